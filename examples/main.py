@@ -1,7 +1,16 @@
 import machine
+from array import array
 from time import sleep_ms
 from mpu6050 import MPU6050 # Import the MPU6050 class from the mpu6050.py file
 
+RING_SIZE = 16             # Number of buffered samples, a power of two
+RING_MASK = RING_SIZE - 1  # Wraps the ring indices without a modulo
+SAMPLE_PERIOD_MS = 20      # 50 Hz
+PRINT_EVERY = 10           # Print one sample out of ten (5 Hz)
+
+# Built once: temperature (°C), acceleration (m/s^2), angular rate (°/s)
+FMT = "T:%.2f A:%.2f,%.2f,%.2f G:%.2f,%.2f,%.2f"
+
 # 1. I2C bus initialization
 # Adapt the pins (sda, scl) to your wiring.
 # Pico: sda=Pin(8), scl=Pin(9) is a common configuration for I2C0.
@@ -15,21 +24,43 @@ try:
 
     print("MPU6050 Found. Reading data...")
 
-    # 3. Main loop to read data
-    while True:
-        # Retrieve all data in a single call (more efficient)
-        all_data = mpu.get_all_data()
-
-        accel = all_data['accel']
-        gyro = all_data['gyro']
-        temp = all_data['temp']
-        
-        # Display formatted data
-        print(f"Temp: {temp:.2f}°C")
-        print(f"Accel (m/s^2): X={accel[0]:.2f}, Y={accel[1]:.2f}, Z={accel[2]:.2f}")
-        print(f"Gyro (°/s): X={gyro[0]:.2f}, Y={gyro[1]:.2f}, Z={gyro[2]:.2f}")
-        
-        sleep_ms(500)
+    # 3. Ring of preallocated samples: ax, ay, az, gx, gy, gz, temp
+    ring = array('f', [0.0] * (RING_SIZE * 7))
+    slots = [memoryview(ring)[i * 7:(i + 1) * 7] for i in range(RING_SIZE)]
+    head = 0 # Next slot written by the producer
+    tail = 0 # Next slot read by the consumer
+    count = 0 # Samples consumed since the last print
+
+    def produce():
+        global head
+        nxt = (head + 1) & RING_MASK
+        if nxt != tail: # The sample is dropped while the ring is full
+            # Collect the primed sample and start the next read right away, so the
+            # bus transfer overlaps with everything done until the next fetch
+            mpu.fetch(slots[head])
+            mpu.prime()
+            head = nxt
+
+    def consume():
+        global tail, count
+        while tail != head:
+            if count == 0:
+                d = slots[tail]
+                print(FMT % (d[6], d[0], d[1], d[2], d[3], d[4], d[5]))
+            count = count + 1 if count < PRINT_EVERY - 1 else 0
+            tail = (tail + 1) & RING_MASK
+
+    # 4. Main loop: printing happens outside the I2C reads
+    mpu.prime()
+    try:
+        while True:
+            # A full ring holds RING_SIZE - 1 samples
+            for _ in range(RING_MASK):
+                produce()
+                sleep_ms(SAMPLE_PERIOD_MS)
+            consume()
+    finally:
+        mpu.close() # Stops the background reader, also on Ctrl-C
 
 except Exception as e:
     print(f"An error occurred: {e}")
@@ -0,0 +1,4 @@
+# Freezes the driver into a custom firmware build, which keeps its bytecode in
+# flash instead of RAM. Include it from the port's manifest:
+#   include("path/to/MPU6050/manifest.py")
+module("mpu6050.py", opt=3)
@@ -9,27 +9,142 @@
 @version 1.1
 """
 
-import struct
+import micropython
+from micropython import const
+from array import array
 from machine import I2C
-from time import sleep_ms
+from time import sleep_ms, ticks_ms, ticks_diff
+
+try:
+    import _thread
+except ImportError:
+    _thread = None  # Port built without threads, see _NoLock
 
 ## @name Register Map
 #  @{
-_MPU6050_DEFAULT_ADDR = 0x68  ##< Default I2C address
-_MPU6050_DEVICE_ID = 0x68      ##< Device ID stored in WHO_AM_I register
-_MPU6050_SMPLRT_DIV = 0x19     ##< Sample Rate Divider register
-_MPU6050_CONFIG = 0x1A         ##< Configuration register
-_MPU6050_GYRO_CONFIG = 0x1B    ##< Gyroscope Configuration register
-_MPU6050_ACCEL_CONFIG = 0x1C   ##< Accelerometer Configuration register
-_MPU6050_ACCEL_OUT = 0x3B      ##< Base address for accelerometer data registers
-_MPU6050_TEMP_OUT = 0x41       ##< Base address for temperature data registers
-_MPU6050_GYRO_OUT = 0x43       ##< Base address for gyroscope data registers
-_MPU6050_PWR_MGMT_1 = 0x6B     ##< Power Management 1 register
-_MPU6050_WHO_AM_I = 0x75       ##< WHO_AM_I register, contains device ID
+_MPU6050_DEFAULT_ADDR = const(0x68)  ##< Default I2C address
+_MPU6050_DEVICE_ID = const(0x68)     ##< Device ID stored in WHO_AM_I register
+_MPU6050_SMPLRT_DIV = const(0x19)    ##< Sample Rate Divider register
+_MPU6050_CONFIG = const(0x1A)        ##< Configuration register
+_MPU6050_GYRO_CONFIG = const(0x1B)   ##< Gyroscope Configuration register
+_MPU6050_ACCEL_CONFIG = const(0x1C)  ##< Accelerometer Configuration register
+_MPU6050_ACCEL_OUT = const(0x3B)     ##< Base address for accelerometer data registers
+_MPU6050_PWR_MGMT_1 = const(0x6B)    ##< Power Management 1 register
+_MPU6050_WHO_AM_I = const(0x75)      ##< WHO_AM_I register, contains device ID
+## @}
+
+## @name PWR_MGMT_1 Bits
+#  @{
+_MPU6050_DEVICE_RESET = const(0x80)  ##< Set to reset, cleared by the sensor once done
 ## @}
 
+_MPU6050_READY_TIMEOUT_MS = const(200)  ##< Upper bound when waiting for the reset to complete
+_MPU6050_STARTUP_MS = const(100)        ##< Settling time after wake-up: gyro start-up (30 ms typ.) and PLL lock
+
 SENSORS_GRAVITY_STANDARD = 9.80665 ##< Standard gravity for conversion to m/s^2
 
+## @name Fixed-Point Scaling
+#  @{
+_FIXED_SHIFT = const(10) ##< Fractional bits of the fixed-point conversion factors
+_TEMP_FIXED = const(3012) ##< 1000 / 340 in Q10, raw temperature to m°C
+## @}
+
+@micropython.native
+def _parse_scale(buf, out, a_scale: float, g_scale: float):
+    """!
+    @brief Decodes and scales an ACCEL_OUT..GYRO_OUT burst in a single pass.
+    @details Compiled with the native emitter as it runs on every sample. Each
+             big-endian word is assembled, sign-extended and scaled straight
+             into the output, so no intermediate tuple or array is built.
+    @param buf The 14 bytes read from the sensor.
+    @param out Destination array('f') of 7 items, see MPU6050.get_all_data_into().
+    @param a_scale Accelerometer conversion factor.
+    @param g_scale Gyroscope conversion factor.
+    """
+    for i in range(7):
+        v = (buf[2 * i] << 8) | buf[2 * i + 1]
+        if v & 0x8000:
+            v -= 0x10000
+        if i < 3:
+            out[i] = v * a_scale
+        elif i == 3:
+            out[6] = (v / 340.0) + 36.53
+        else:
+            out[i - 1] = v * g_scale
+
+@micropython.viper
+def _parse_fixed(buf: ptr8, out: ptr32, a_fixed: int, g_fixed: int):
+    """!
+    @brief Integer-only counterpart of _parse_scale().
+    @details Ports without a hardware FPU (e.g. the RP2040) emulate every float
+             operation in software. This viper kernel instead scales with Q10
+             multipliers, and the products stay within 32 bits for every range.
+    @param buf The 14 bytes read from the sensor.
+    @param out Destination array('i') of 7 items, see MPU6050.get_all_fixed_into().
+    @param a_fixed Accelerometer factor, raw to mm/s^2, in Q10.
+    @param g_fixed Gyroscope factor, raw to m°/s, in Q10.
+    """
+    for i in range(7):
+        v = (buf[2 * i] << 8) | buf[2 * i + 1]
+        if v & 0x8000:
+            v -= 0x10000
+        if i < 3:
+            out[i] = (v * a_fixed) >> _FIXED_SHIFT
+        elif i == 3:
+            out[6] = ((v * _TEMP_FIXED) >> _FIXED_SHIFT) + 36530
+        else:
+            out[i - 1] = (v * g_fixed) >> _FIXED_SHIFT
+
+@micropython.viper
+def _parse_raw(buf: ptr8, out: ptr16):
+    """!
+    @brief Byte-swaps an ACCEL_OUT..GYRO_OUT burst without scaling it.
+    @details The 16-bit stores truncate, so the signed destination array reads
+             the values back sign-extended.
+    @param buf The 14 bytes read from the sensor.
+    @param out Destination array('h') of 7 items, see MPU6050.get_all_raw_into().
+    """
+    for i in range(7):
+        v = (buf[2 * i] << 8) | buf[2 * i + 1]
+        if i < 3:
+            out[i] = v
+        elif i == 3:
+            out[6] = v
+        else:
+            out[i - 1] = v
+
+class _NoLock:
+    """!
+    @brief Stand-in bus lock for ports built without the _thread module.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+## @brief Source of the range-specialized kernel, see MPU6050._update_scales().
+#  @details Same computation as _parse_scale() but unrolled, with the conversion
+#           factors substituted as literals and a branchless sign extension.
+_SPECIALIZED_SRC = """@micropython.native
+def _parse(buf, out):
+    v = (buf[0] << 8) | buf[1]
+    out[0] = (v - ((v & 0x8000) << 1)) * {a!r}
+    v = (buf[2] << 8) | buf[3]
+    out[1] = (v - ((v & 0x8000) << 1)) * {a!r}
+    v = (buf[4] << 8) | buf[5]
+    out[2] = (v - ((v & 0x8000) << 1)) * {a!r}
+    v = (buf[6] << 8) | buf[7]
+    out[6] = (v - ((v & 0x8000) << 1)) * {t!r} + 36.53
+    v = (buf[8] << 8) | buf[9]
+    out[3] = (v - ((v & 0x8000) << 1)) * {g!r}
+    v = (buf[10] << 8) | buf[11]
+    out[4] = (v - ((v & 0x8000) << 1)) * {g!r}
+    v = (buf[12] << 8) | buf[13]
+    out[5] = (v - ((v & 0x8000) << 1)) * {g!r}
+"""
+
 class MPU6050:
     """!
     @brief Driver class for the MPU6050 sensor.
@@ -64,77 +179,162 @@ class MPU6050:
         BAND_5_HZ = 0x06   ##< 5 Hz
     ## @}
 
-    # Sensitivity scales based on datasheet
-    _ACCEL_SCALES = {
-        AccelRange.RANGE_2_G: 16384.0,
-        AccelRange.RANGE_4_G: 8192.0,
-        AccelRange.RANGE_8_G: 4096.0,
-        AccelRange.RANGE_16_G: 2048.0,
-    }
+    # Sensitivity scales based on datasheet, indexed by range code
+    _ACCEL_SCALES = (
+        16384.0, # AccelRange.RANGE_2_G
+        8192.0,  # AccelRange.RANGE_4_G
+        4096.0,  # AccelRange.RANGE_8_G
+        2048.0,  # AccelRange.RANGE_16_G
+    )
 
-    _GYRO_SCALES = {
-        GyroRange.RANGE_250_DEG: 131.0,
-        GyroRange.RANGE_500_DEG: 65.5,
-        GyroRange.RANGE_1000_DEG: 32.8,
-        GyroRange.RANGE_2000_DEG: 16.4,
-    }
+    _GYRO_SCALES = (
+        131.0, # GyroRange.RANGE_250_DEG
+        65.5,  # GyroRange.RANGE_500_DEG
+        32.8,  # GyroRange.RANGE_1000_DEG
+        16.4,  # GyroRange.RANGE_2000_DEG
+    )
 
-    def __init__(self, i2c: I2C, address: int = _MPU6050_DEFAULT_ADDR):
+    def __init__(self, i2c: I2C, address: int = _MPU6050_DEFAULT_ADDR, lock=None):
         """!
         @brief Initializes the MPU6050 sensor.
-        @param i2c The Micropython I2C object.
+        @param i2c The Micropython I2C object. A hardware machine.I2C at 400 kHz is
+                   preferred over machine.SoftI2C, which bit-bangs the bus on the CPU.
         @param address The I2C address of the sensor (default is 0x68).
+        @param lock Lock held around every transaction, shared with the other drivers
+                    on the same bus. A new one is allocated when omitted, see bus_lock.
         """
         self.i2c = i2c
         self.address = address
+        if lock is None:
+            lock = _thread.allocate_lock() if _thread else _NoLock()
+        self._lock = lock
         self._accel_range = self.AccelRange.RANGE_2_G
-        self._gyro_range = self.GyroRange.RANGE_250_DEG
+        self._gyro_range = self.GyroRange.RANGE_500_DEG
+        # Preallocated so the reads do not allocate on every sample
+        self._buf14 = bytearray(14)
+        self._buf1 = bytearray(1)
+        self._wbuf1 = bytearray(1)
+        self._data = array('f', [0.0] * 7)
+        # State shared with the background reader of prime() / fetch()
+        self._pipe_buf = bytearray(14)
+        self._pipe_pending = False
+        self._pipe_error = None
+        self._pipe_req = None     # Released by prime() to request a read
+        self._pipe_done = None    # Released by the reader once the burst is in
+        self._pipe_exited = None  # Released by the reader when it returns
 
         if self._read_u8(_MPU6050_WHO_AM_I) != _MPU6050_DEVICE_ID:
             raise RuntimeError(f"MPU6050 not found at I2C address {hex(self.address)}")
 
         self.reset()
-        self.set_accel_range(self.AccelRange.RANGE_2_G)
-        self.set_gyro_range(self.GyroRange.RANGE_500_DEG)
-        self.set_filter_bandwidth(self.FilterBandwidth.BAND_260_HZ)
+        # SMPLRT_DIV, CONFIG, GYRO_CONFIG and ACCEL_CONFIG are consecutive registers,
+        # so the default configuration goes out in a single burst
+        self._write_bytes(_MPU6050_SMPLRT_DIV, bytes((
+            0x00,  # Sample rate divider: gyroscope output rate
+            self.FilterBandwidth.BAND_260_HZ,
+            self._gyro_range << 3,
+            self._accel_range << 3,
+        )))
+        self._update_scales()
         self._write_u8(_MPU6050_PWR_MGMT_1, 0x01)  # Wake up sensor, set clock to Gyro X PLL
-        sleep_ms(100)
+        # No register reports the gyroscope start-up or the PLL lock, so wait it out
+        sleep_ms(_MPU6050_STARTUP_MS)
 
     def _read_u8(self, register: int) -> int:
-        return self.i2c.readfrom_mem(self.address, register, 1)[0]
+        with self._lock:
+            buf = self._buf1
+            self.i2c.readfrom_mem_into(self.address, register, buf)
+            return buf[0]
 
     def _write_u8(self, register: int, value: int):
-        self.i2c.writeto_mem(self.address, register, bytearray([value]))
+        with self._lock:
+            buf = self._wbuf1
+            buf[0] = value
+            self.i2c.writeto_mem(self.address, register, buf)
+
+    def _write_bytes(self, register: int, data: bytes):
+        with self._lock:
+            self.i2c.writeto_mem(self.address, register, data)
+
+    def _read_into(self, register: int, buf: bytearray):
+        with self._lock:
+            self.i2c.readfrom_mem_into(self.address, register, buf)
 
-    def _read_bytes(self, register: int, length: int) -> bytes:
-        return self.i2c.readfrom_mem(self.address, register, length)
+    def _wait_clear(self, register: int, mask: int):
+        # Polls until the masked bits read back as zero, instead of a fixed delay
+        start = ticks_ms()
+        while True:
+            try:
+                if not self._read_u8(register) & mask:
+                    return
+            except OSError:
+                pass  # The sensor may not acknowledge while it resets
+            if ticks_diff(ticks_ms(), start) > _MPU6050_READY_TIMEOUT_MS:
+                raise RuntimeError(f"MPU6050 at I2C address {hex(self.address)} is not ready")
+            sleep_ms(1)
+
+    def _update_scales(self):
+        # Cache the conversion factors so the read paths multiply instead of divide
+        scale = self._ACCEL_SCALES[self._accel_range]
+        a = self._accel_scale_ms2 = SENSORS_GRAVITY_STANDARD / scale
+        self._accel_scale_g = 1.0 / scale
+        g = self._gyro_scale = 1.0 / self._GYRO_SCALES[self._gyro_range]
+        self._accel_fixed = int(a * 1000 * (1 << _FIXED_SHIFT) + 0.5)
+        self._gyro_fixed = int(g * 1000 * (1 << _FIXED_SHIFT) + 0.5)
+        # Compile a kernel with the factors as literals; ports built without
+        # the compiler fall back to the generic kernel
+        try:
+            ns = {'micropython': micropython}
+            exec(_SPECIALIZED_SRC.format(a=a, g=g, t=1.0 / 340.0), ns)
+            self._parse = ns['_parse']
+        except (NameError, MemoryError):
+            def _parse(buf, out):
+                _parse_scale(buf, out, a, g)
+            self._parse = _parse
+
+    @property
+    def bus_lock(self):
+        """!
+        @brief The lock held around each I2C transaction of this sensor.
+        @details Pass it to the other drivers sharing the bus, or hold it around
+                 their transactions, so that threads never interleave on the bus.
+                 Reads also decode their result before releasing it, so one
+                 instance can be read from several threads.
+                 The lock is not re-entrant: calling any method of this sensor
+                 while holding it deadlocks.
+        """
+        return self._lock
 
     def reset(self):
         """!
         @brief Resets sensor registers to their default values.
+        @details Returns as soon as the sensor clears its DEVICE_RESET bit, and raises
+                 RuntimeError if that takes longer than 200 ms.
         """
-        self._write_u8(_MPU6050_PWR_MGMT_1, 0x80)
-        sleep_ms(100)
+        self._write_u8(_MPU6050_PWR_MGMT_1, _MPU6050_DEVICE_RESET)
+        self._wait_clear(_MPU6050_PWR_MGMT_1, _MPU6050_DEVICE_RESET)
 
     def set_accel_range(self, accel_range: int):
         """!
         @brief Sets the accelerometer measurement range.
         @param accel_range Use constants from MPU6050.AccelRange.
         """
-        if accel_range not in self._ACCEL_SCALES:
+        if not 0x00 <= accel_range <= 0x03:
             raise ValueError("Invalid accelerometer range")
         self._write_u8(_MPU6050_ACCEL_CONFIG, accel_range << 3)
         self._accel_range = accel_range
+        self._update_scales()
 
     def set_gyro_range(self, gyro_range: int):
         """!
         @brief Sets the gyroscope measurement range.
         @param gyro_range Use constants from MPU6050.GyroRange.
         """
-        if gyro_range not in self._GYRO_SCALES:
+        if not 0x00 <= gyro_range <= 0x03:
             raise ValueError("Invalid gyroscope range")
         self._write_u8(_MPU6050_GYRO_CONFIG, gyro_range << 3)
         self._gyro_range = gyro_range
+        self._update_scales()
 
     def set_filter_bandwidth(self, bandwidth: int):
         """!
@@ -148,65 +348,198 @@ class MPU6050:
     def get_accel_data(self, as_g: bool = False) -> tuple[float, float, float]:
         """!
         @brief Reads and converts the accelerometer data.
+        @details Legacy accessor: it performs the full 14-byte burst of
+                 get_all_data_into(), so reading several sensors this way costs
+                 one bus transaction each. Prefer get_all_data_into().
         @param as_g If True, returns values in 'g'. Otherwise, returns in m/s^2 (default).
         @return A tuple of 3 floats (x, y, z).
         """
-        data = self._read_bytes(_MPU6050_ACCEL_OUT, 6)
-        raw_x, raw_y, raw_z = struct.unpack('>hhh', data)
-        
-        scale = self._ACCEL_SCALES[self._accel_range]
-        x = raw_x / scale
-        y = raw_y / scale
-        z = raw_z / scale
-        
-        if as_g:
-            return x, y, z
-        
-        return x * SENSORS_GRAVITY_STANDARD, y * SENSORS_GRAVITY_STANDARD, z * SENSORS_GRAVITY_STANDARD
+        d = self._data
+        with self._lock:
+            buf = self._buf14
+            self.i2c.readfrom_mem_into(self.address, _MPU6050_ACCEL_OUT, buf)
+            if as_g:
+                _parse_scale(buf, d, self._accel_scale_g, self._gyro_scale)
+            else:
+                self._parse(buf, d)
+            return d[0], d[1], d[2]
 
     def get_gyro_data(self) -> tuple[float, float, float]:
         """!
         @brief Reads and converts the gyroscope data in degrees per second.
+        @details Legacy accessor built on get_all_data_into(), see get_accel_data().
         @return A tuple of 3 floats (x, y, z) in °/s.
         """
-        data = self._read_bytes(_MPU6050_GYRO_OUT, 6)
-        raw_x, raw_y, raw_z = struct.unpack('>hhh', data)
-        
-        scale = self._GYRO_SCALES[self._gyro_range]
-        x = raw_x / scale
-        y = raw_y / scale
-        z = raw_z / scale
-        
-        return x, y, z
+        d = self._data
+        with self._lock:
+            buf = self._buf14
+            self.i2c.readfrom_mem_into(self.address, _MPU6050_ACCEL_OUT, buf)
+            self._parse(buf, d)
+            return d[3], d[4], d[5]
 
     def get_temp_data(self) -> float:
         """!
         @brief Reads and converts the temperature data.
+        @details Legacy accessor built on get_all_data_into(), see get_accel_data().
         @return The temperature in degrees Celsius.
         """
-        data = self._read_bytes(_MPU6050_TEMP_OUT, 2)
-        raw_temp = struct.unpack('>h', data)[0]
-        temp_c = (raw_temp / 340.0) + 36.53
-        return temp_c
+        d = self._data
+        with self._lock:
+            buf = self._buf14
+            self.i2c.readfrom_mem_into(self.address, _MPU6050_ACCEL_OUT, buf)
+            self._parse(buf, d)
+            return d[6]
+
+    @micropython.native
+    def get_all_data_into(self, out):
+        """!
+        @brief Reads all sensor data in a single transaction into a caller-supplied array.
+        @details Nothing is allocated, which makes this the preferred call for
+                 tight sampling loops. Decoding uses a kernel compiled for the
+                 current ranges, with the conversion factors embedded as literals.
+        @param out An array('f') of at least 7 items, filled with
+                   (ax, ay, az) in m/s^2, (gx, gy, gz) in °/s and the temperature in °C.
+        """
+        with self._lock:
+            buf = self._buf14
+            self.i2c.readfrom_mem_into(self.address, _MPU6050_ACCEL_OUT, buf)
+            self._parse(buf, out)
+
+    def get_all_fixed_into(self, out):
+        """!
+        @brief Reads all sensor data into a caller-supplied array using integer math only.
+        @details Same transaction as get_all_data_into(), scaled in fixed point so
+                 that no float operation runs on ports that emulate them in software.
+                 Convert to floats only where needed, e.g. when printing.
+        @param out An array('i') of at least 7 items, filled with (ax, ay, az) in
+                   mm/s^2, (gx, gy, gz) in m°/s and the temperature in m°C.
+        """
+        with self._lock:
+            buf = self._buf14
+            self.i2c.readfrom_mem_into(self.address, _MPU6050_ACCEL_OUT, buf)
+            _parse_fixed(buf, out, self._accel_fixed, self._gyro_fixed)
+
+    def get_all_raw_into(self, out):
+        """!
+        @brief Reads all sensor data into a caller-supplied array without any scaling.
+        @details The fastest read: one transaction and a byte swap, with no
+                 allocation and no arithmetic. Suited to buffering samples and
+                 scaling them later in bulk, using the datasheet sensitivities
+                 (LSB per g, LSB per °/s) and temp = raw / 340 + 36.53.
+        @param out An array('h') of at least 7 items, filled with the raw
+                   (ax, ay, az), (gx, gy, gz) and temperature readings.
+        """
+        with self._lock:
+            buf = self._buf14
+            self.i2c.readfrom_mem_into(self.address, _MPU6050_ACCEL_OUT, buf)
+            _parse_raw(buf, out)
+
+    def prime(self):
+        """!
+        @brief Starts the read of the next sample, to be collected with fetch().
+        @details On ports with _thread, the 14-byte burst runs in a background thread
+                 while the caller processes the previous sample. The thread is started
+                 by the first call and sleeps on a lock between reads; close() stops it.
+                 The RP2040 runs it on core1, which hosts a single thread, so only one
+                 sensor can be pipelined at a time there. Ports without _thread read
+                 the burst before returning. Does nothing if a read is already in
+                 flight or waiting to be fetched. prime() and fetch() must be called
+                 from a single thread.
+        """
+        if self._pipe_pending:
+            return
+        if _thread is None:
+            self._read_into(_MPU6050_ACCEL_OUT, self._pipe_buf)
+        else:
+            if self._pipe_req is None:
+                self._pipe_start()
+            self._pipe_req.release()  # Wakes the background reader
+        self._pipe_pending = True
+
+    def fetch(self, out):
+        """!
+        @brief Waits for the read started by prime() and decodes it.
+        @details Typical loop: prime() once, then fetch(), prime() and process the
+                 sample, so that the next bus transfer overlaps the processing.
+                 Calls prime() itself when no read is in flight. Any exception raised
+                 by the background read is raised here; a stalled bus is reported by
+                 the timeout of the I2C driver itself, as an OSError.
+        @param out An array('f') of at least 7 items, filled as by get_all_data_into().
+        """
+        if not self._pipe_pending:
+            self.prime()
+        if _thread is not None:
+            self._pipe_done.acquire()  # Blocks until the reader has the burst
+        self._pipe_pending = False
+        err = self._pipe_error
+        if err is not None:
+            self._pipe_error = None
+            raise err
+        self._parse(self._pipe_buf, out)
+
+    def close(self):
+        """!
+        @brief Stops the background reader started by prime(), if any.
+        @details Returns once the thread has exited, which frees it (and core1 on an
+                 RP2040) for other uses. A read that was primed but not fetched is
+                 discarded, along with its error. A later prime() starts a new reader.
+        """
+        req = self._pipe_req
+        if req is None:
+            return
+        exited = self._pipe_exited
+        self._pipe_req = None  # Tells the reader to exit once it wakes up
+        self._pipe_done = None
+        self._pipe_exited = None
+        self._pipe_pending = False
+        try:
+            req.release()
+        except RuntimeError:
+            pass  # Already released by a prime() the reader has not picked up yet
+        exited.acquire()
+        self._pipe_error = None
+
+    def _pipe_start(self):
+        req = _thread.allocate_lock()
+        done = _thread.allocate_lock()
+        exited = _thread.allocate_lock()
+        req.acquire()
+        done.acquire()
+        exited.acquire()
+        self._pipe_req = req
+        self._pipe_done = done
+        self._pipe_exited = exited
+        try:
+            _thread.start_new_thread(self._pipe_worker, (req, done, exited))
+        except Exception:
+            self._pipe_req = self._pipe_done = self._pipe_exited = None
+            raise
+
+    def _pipe_worker(self, req, done, exited):
+        # Background reader for prime(): blocks on the request lock between reads
+        # and exits once close() has detached its locks from the instance
+        buf = self._pipe_buf
+        try:
+            while True:
+                req.acquire()
+                if self._pipe_req is not req:
+                    return
+                try:
+                    self._read_into(_MPU6050_ACCEL_OUT, buf)
+                except Exception as e:
+                    self._pipe_error = e  # Raised by fetch() in the caller's thread
+                done.release()
+        finally:
+            exited.release()  # Lets close() return
 
     def get_all_data(self) -> dict:
         """!
         @brief Reads all sensor data in a single, efficient transaction.
         @return A dictionary containing 'accel' (m/s^2), 'gyro' (°/s), and 'temp' (°C).
         """
-        data = self._read_bytes(_MPU6050_ACCEL_OUT, 14)
-        raw_ax, raw_ay, raw_az, raw_t, raw_gx, raw_gy, raw_gz = struct.unpack('>hhhhhhh', data)
-        
-        accel_scale = self._ACCEL_SCALES[self._accel_range]
-        ax = (raw_ax / accel_scale) * SENSORS_GRAVITY_STANDARD
-        ay = (raw_ay / accel_scale) * SENSORS_GRAVITY_STANDARD
-        az = (raw_az / accel_scale) * SENSORS_GRAVITY_STANDARD
-        
-        temp = (raw_t / 340.0) + 36.53
-        
-        gyro_scale = self._GYRO_SCALES[self._gyro_range]
-        gx = raw_gx / gyro_scale
-        gy = raw_gy / gyro_scale
-        gz = raw_gz / gyro_scale
-        
-        return {'accel': (ax, ay, az), 'gyro': (gx, gy, gz), 'temp': temp}
\ No newline at end of file
+        d = self._data
+        with self._lock:
+            buf = self._buf14
+            self.i2c.readfrom_mem_into(self.address, _MPU6050_ACCEL_OUT, buf)
+            self._parse(buf, d)
+            return {'accel': (d[0], d[1], d[2]), 'gyro': (d[3], d[4], d[5]), 'temp': d[6]}
\ No newline at end of file